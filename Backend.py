@@ -5,25 +5,42 @@ Receives GitHub workflow run webhooks and stores data in SQLite database
 """
 
 import os
-import json
+import orjson
+import queue
+import atexit
 import sqlite3
-import hashlib
+import threading
+import time
+import functools
+import ssl
 import hmac
 import logging
-from datetime import datetime, timezone
-from flask import Flask, request, jsonify
+from logging.handlers import QueueHandler, QueueListener
+from flask import Flask, Response, request, jsonify, make_response
+from flask.json.provider import JSONProvider
 from flask_restx import Api, Resource, fields, Namespace
-from contextlib import contextmanager
+from werkzeug.exceptions import RequestEntityTooLarge
+from contextlib import closing, contextmanager
+from types import SimpleNamespace
+from typing import NamedTuple, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; records are handed to a queue and written by a listener
+# thread so request handlers never block on stream I/O
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# GitHub caps webhook payloads at 25 MB; refuse anything larger before buffering it
+app.config['MAX_CONTENT_LENGTH'] = 25 * 1024 * 1024
+
 # Initialize Flask-RESTX for Swagger documentation
 api = Api(
     app,
@@ -34,38 +51,224 @@ api = Api(
     prefix='/api/v1'
 )
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+@api.representation('application/json')
+def output_json(data, code, headers=None):
+    """Serialize API responses with orjson instead of the stdlib encoder"""
+    response = make_response(orjson.dumps(data), code)
+    response.headers.extend(headers or {})
+    return response
+
+def _to_namespace(value):
+    """Recursively convert parsed JSON objects to attribute-access namespaces"""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{key: _to_namespace(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(item) for item in value]
+    return value
+
+@functools.lru_cache(maxsize=1)
 def load_config(config_path='config.json'):
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file, parsed once per path"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        logger.info(f"Configuration loaded from {config_path}")
+        with open(config_path, 'rb') as f:
+            config = _to_namespace(orjson.loads(f.read()))
+        logger.info("Configuration loaded from %s", config_path)
         return config
     except FileNotFoundError:
-        logger.error(f"Config file {config_path} not found")
+        logger.error("Config file %s not found", config_path)
         raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in config file: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON in config file: %s", e)
         raise
 
 # Load configuration
 config = load_config()
-DATABASE_PATH = config['database']['path']
-WEBHOOK_SECRET = config['webhook']['secret']
-PORT = config['backend']['port']
-HOST = config['backend']['host']
+DATABASE_PATH = config.database.path
+WEBHOOK_SECRET = config.webhook.secret
+PORT = config.backend.port
+HOST = config.backend.host
+
+# SQLite tuning: WAL lets readers run alongside the webhook writer, and
+# synchronous=NORMAL only fsyncs at checkpoints instead of on every commit
+SQLITE_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA busy_timeout=30000',
+)
+
+# Webhook writes are queued and committed in batches by a background thread
+WRITE_BATCH_SIZE = 500
+WRITE_BATCH_WINDOW = 0.05  # seconds to wait for more rows before committing
+WRITE_QUEUE_SIZE = 10000
+
+# SQL kept as module constants so repeated calls reuse the cached prepared statement
+_SQL_CREATE_RUN_INDEX = '''
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_repo_wf_run 
+    ON workflow_runs(repository_name, workflow_id, run_id)
+'''
+
+# Every row of a duplicated run except the one to keep
+_SQL_SELECT_DUPLICATE_RUNS = '''
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY repository_name, workflow_id, run_id
+            ORDER BY updated_at DESC, id ASC
+        ) AS position
+        FROM workflow_runs 
+        WHERE run_id IS NOT NULL
+    )
+    WHERE position > 1
+    ORDER BY id
+'''
+
+_SQL_UPSERT_WORKFLOW = '''
+    INSERT INTO workflow_runs 
+    (repository_name, workflow_id, workflow_name, workflow_conclusion, 
+     run_id, run_number, run_url, head_branch)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(repository_name, workflow_id, run_id) DO UPDATE SET
+        workflow_name = excluded.workflow_name,
+        workflow_conclusion = excluded.workflow_conclusion,
+        run_number = excluded.run_number,
+        run_url = excluded.run_url,
+        head_branch = excluded.head_branch,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+_SQL_SELECT_ALL = '''
+    SELECT * FROM workflow_runs 
+    ORDER BY created_at DESC 
+    LIMIT ?
+'''
+
+_SQL_SELECT_BY_REPO = '''
+    SELECT * FROM workflow_runs 
+    WHERE repository_name LIKE ?
+    ORDER BY created_at DESC 
+    LIMIT ?
+'''
+
+# Readers reserved for streamed /workflows responses, which stay checked out
+# while the client downloads, so slow clients never starve /health or writes
+STREAM_READERS = 4
+
+# Per-connection prepared statement cache (sqlite3 defaults to 128)
+SQLITE_CACHED_STATEMENTS = 256
+
+class WorkflowRow(NamedTuple):
+    """A workflow_runs record, in the column order of the upsert statement"""
+    repo_name: str
+    workflow_id: int
+    workflow_name: str
+    workflow_conclusion: Optional[str]
+    run_id: Optional[int]
+    run_number: Optional[int]
+    run_url: Optional[str]
+    head_branch: Optional[str]
+
+class ConnectionPool:
+    """Persistent SQLite connections: one shared writer plus queues of readers"""
+    
+    def __init__(self, db_path, readers=None, streamers=STREAM_READERS):
+        self.db_path = db_path
+        # The writer runs in autocommit mode and opens its own BEGIN IMMEDIATE
+        # transactions, so the write lock is taken up front rather than upgraded
+        self._writer = self._connect(isolation_level=None)
+        self._writer_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers or min(8, os.cpu_count() or 1)):
+            self._readers.put(self._connect())
+        self._streamers = queue.Queue()
+        for _ in range(streamers):
+            self._streamers.put(self._connect())
+    
+    def _connect(self, isolation_level=''):
+        """Open a connection usable from any request thread"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               isolation_level=isolation_level,
+                               cached_statements=SQLITE_CACHED_STATEMENTS)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def connection(self, write=False):
+        """Check out the writer (serialized by a lock) or a free reader"""
+        if write:
+            with self._writer_lock:
+                try:
+                    yield self._writer
+                finally:
+                    if self._writer.in_transaction:
+                        self._writer.rollback()
+        else:
+            conn = self._readers.get()
+            try:
+                yield conn
+            finally:
+                self._readers.put(conn)
+    
+    @contextmanager
+    def streaming(self):
+        """Check out a reader kept apart from the request pool for streamed responses"""
+        conn = self._streamers.get()
+        try:
+            yield conn
+        finally:
+            self._streamers.put(conn)
+    
+    def close(self):
+        """Refresh planner statistics and close every pooled connection"""
+        with self._writer_lock:
+            self._close_connection(self._writer)
+        for connections in (self._readers, self._streamers):
+            while not connections.empty():
+                self._close_connection(connections.get_nowait())
+    
+    @staticmethod
+    def _close_connection(conn):
+        """Let SQLite re-analyze tables whose queries would benefit, then close"""
+        try:
+            conn.execute('PRAGMA optimize')
+        except sqlite3.Error as e:
+            logger.warning("PRAGMA optimize failed: %s", e)
+        conn.close()
 
 class DatabaseManager:
     """Handles SQLite database operations"""
     
     def __init__(self, db_path):
         self.db_path = db_path
+        self.pool = ConnectionPool(db_path)
         self.init_database()
+        
+        self._queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(target=self._writer_loop, name='db-writer', daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
     
     def init_database(self):
         """Initialize the database and create tables if they don't exist"""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
+            
+            # WAL is persistent, so it only needs to be set once per database file
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
+            cursor.execute('BEGIN IMMEDIATE')
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS workflow_runs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -88,55 +291,118 @@ class DatabaseManager:
                 ON workflow_runs(repository_name, workflow_id)
             ''')
             
-            conn.commit()
-            logger.info("Database initialized successfully")
-    
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
-        try:
-            yield conn
-        finally:
-            conn.close()
-    
-    def insert_workflow_run(self, repo_name, workflow_id, workflow_name, 
-                          workflow_conclusion, run_id=None, run_number=None,
-                          run_url=None, head_branch=None):
-        """Insert or update a workflow run record"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+            # Covering index so /workflows can read newest-first without sorting or row lookups
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_workflow_runs_created 
+                ON workflow_runs(created_at DESC, repository_name, workflow_id, workflow_name,
+                                 workflow_conclusion, run_id, run_number, run_url, head_branch, updated_at)
+            ''')
             
-            # Check if record already exists
+            # Case-insensitive index so prefix LIKE filters on repository can seek
             cursor.execute('''
-                SELECT id FROM workflow_runs 
-                WHERE repository_name = ? AND workflow_id = ? AND run_id = ?
-            ''', (repo_name, workflow_id, run_id))
+                CREATE INDEX IF NOT EXISTS idx_repository_nocase 
+                ON workflow_runs(repository_name COLLATE NOCASE)
+            ''')
             
-            existing_record = cursor.fetchone()
+            # One row per run; backs the ON CONFLICT target of the webhook upsert
+            try:
+                cursor.execute(_SQL_CREATE_RUN_INDEX)
+            except sqlite3.IntegrityError:
+                # Older databases may hold duplicates from racing webhooks. Their
+                # updates went to the lowest id, so keep the most recently updated
+                # row and fall back to the lowest id when timestamps tie.
+                duplicate_ids = [row[0] for row in cursor.execute(_SQL_SELECT_DUPLICATE_RUNS)]
+                cursor.executemany('DELETE FROM workflow_runs WHERE id = ?',
+                                   [(duplicate_id,) for duplicate_id in duplicate_ids])
+                logger.warning("Removed %d duplicate workflow runs: ids %s", len(duplicate_ids), duplicate_ids)
+                cursor.execute(_SQL_CREATE_RUN_INDEX)
             
-            if existing_record:
-                # Update existing record
-                cursor.execute('''
-                    UPDATE workflow_runs 
-                    SET workflow_name = ?, workflow_conclusion = ?, 
-                        run_number = ?, run_url = ?, head_branch = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                ''', (workflow_name, workflow_conclusion, run_number, run_url, head_branch, existing_record[0]))
-                logger.info(f"Updated workflow run: {repo_name}/{workflow_name} (ID: {run_id})")
-            else:
-                # Insert new record
-                cursor.execute('''
-                    INSERT INTO workflow_runs 
-                    (repository_name, workflow_id, workflow_name, workflow_conclusion, 
-                     run_id, run_number, run_url, head_branch)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (repo_name, workflow_id, workflow_name, workflow_conclusion, 
-                      run_id, run_number, run_url, head_branch))
-                logger.info(f"Inserted new workflow run: {repo_name}/{workflow_name} (ID: {run_id})")
+            cursor.execute('COMMIT')
+            logger.info("Database initialized successfully")
+    
+    def get_connection(self, write=False):
+        """Context manager for pooled database connections"""
+        return self.pool.connection(write=write)
+    
+    def get_streaming_connection(self):
+        """Context manager for a reader from the streaming pool"""
+        return self.pool.streaming()
+    
+    def insert_workflow_run(self, row):
+        """Queue a WorkflowRow for the background writer"""
+        # Blocks when the queue is full so bursts apply backpressure to callers
+        self._queue.put(row)
+    
+    def _writer_loop(self):
+        """Drain queued records and commit them in batches"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WINDOW
+            while len(batch) < WRITE_BATCH_SIZE and batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
             
-            conn.commit()
+            stopping = batch[-1] is None
+            rows = [row for row in batch if row is not None]
+            if rows:
+                try:
+                    self._write_batch(rows)
+                except Exception as e:
+                    logger.error("Error writing workflow runs: %s", e)
+            if stopping:
+                return
+    
+    def _write_batch(self, rows):
+        """Insert or update a batch of workflow run records in one transaction"""
+        try:
+            # Keep only the latest event per run; rows without a run_id are never merged
+            latest = {}
+            for i, row in enumerate(rows):
+                key = (row.repo_name, row.workflow_id, row.run_id) if row.run_id is not None else i
+                latest[key] = row
+            self._upsert(latest.values())
+            written = list(latest.values())
+        except Exception as e:
+            # These webhooks were already acknowledged and won't be redelivered, so
+            # fall back to one transaction per row in arrival order, which keeps the
+            # latest event per run and drops only the rows that fail on their own
+            logger.error("Error writing batch of %d workflow runs, retrying row by row: %s", len(rows), e)
+            written = []
+            for row in rows:
+                try:
+                    self._upsert((row,))
+                except Exception as e:
+                    logger.error("Dropping workflow run %r: %s", row, e)
+                else:
+                    written.append(row)
+        
+        logger.info("Upserted %d workflow runs", len(written))
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in written:
+                logger.debug("Upserted workflow run: %s/%s (ID: %s)", row.repo_name, row.workflow_name, row.run_id)
+    
+    def _upsert(self, rows):
+        """Upsert rows in a single write transaction"""
+        with self.get_connection(write=True) as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(_SQL_UPSERT_WORKFLOW, rows)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+    
+    def close(self):
+        """Flush queued writes, stop the writer thread and close connections"""
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._writer_thread.join(timeout=5)
+        self.pool.close()
 
 # Initialize database manager
 db_manager = DatabaseManager(DATABASE_PATH)
@@ -209,33 +475,71 @@ health_response_model = api.model('HealthResponse', {
     'timestamp': fields.String(description='Check timestamp')
 })
 
+# Key the HMAC once; each request copies the pre-keyed state instead of
+# re-deriving the inner/outer pads from the secret
+_WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode('utf-8') if WEBHOOK_SECRET else None
+_HMAC_TEMPLATE = hmac.new(_WEBHOOK_SECRET_BYTES, digestmod='sha256') if _WEBHOOK_SECRET_BYTES else None
+
 def verify_webhook_signature(payload_body, signature_header):
     """Verify GitHub webhook signature if secret is configured"""
-    if not WEBHOOK_SECRET:
+    if _HMAC_TEMPLATE is None:
         return True  # Skip verification if no secret is configured
     
     if not signature_header:
         return False
     
     try:
-        hash_object = hmac.new(
-            WEBHOOK_SECRET.encode('utf-8'),
-            msg=payload_body,
-            digestmod=hashlib.sha256
-        )
+        # OpenSSL-backed HMAC; its SHA-256 uses SHA-NI when the CPU provides it
+        hash_object = _HMAC_TEMPLATE.copy()
+        hash_object.update(payload_body)
         expected_signature = "sha256=" + hash_object.hexdigest()
         return hmac.compare_digest(expected_signature, signature_header)
     except Exception as e:
-        logger.error(f"Error verifying webhook signature: {e}")
+        logger.error("Error verifying webhook signature: %s", e)
         return False
 
+def _row_from_workflow_run(payload):
+    """Extract the stored fields from a workflow_run event"""
+    workflow_run = payload.get('workflow_run') or {}
+    return WorkflowRow(
+        repo_name=(payload.get('repository') or {}).get('full_name'),
+        workflow_id=workflow_run.get('workflow_id'),
+        workflow_name=workflow_run.get('name'),
+        workflow_conclusion=workflow_run.get('conclusion'),
+        run_id=workflow_run.get('id'),
+        run_number=workflow_run.get('run_number'),
+        run_url=workflow_run.get('html_url'),
+        head_branch=workflow_run.get('head_branch')
+    )
+
+def _row_from_workflow_job(payload):
+    """Extract the stored fields from a workflow_job event"""
+    workflow_job = payload.get('workflow_job') or {}
+    return WorkflowRow(
+        repo_name=(payload.get('repository') or {}).get('full_name'),
+        workflow_id=workflow_job.get('id'),  # Use job ID as workflow_id
+        workflow_name=workflow_job.get('workflow_name', workflow_job.get('name')),
+        workflow_conclusion=workflow_job.get('conclusion'),
+        run_id=workflow_job.get('run_id'),
+        run_number=None,  # Not available in workflow_job
+        run_url=workflow_job.get('run_url'),
+        head_branch=workflow_job.get('head_branch')
+    )
+
+# Supported GitHub events and how to turn each payload into a row
+_ROW_BUILDERS = {
+    'workflow_run': _row_from_workflow_run,
+    'workflow_job': _row_from_workflow_job,
+}
+
 @webhook_ns.route('')
 class GitHubWebhook(Resource):
     @webhook_ns.doc('process_webhook')
-    @webhook_ns.expect(github_webhook_model)
+    @webhook_ns.doc(body=github_webhook_model)  # Documented only; payloads are read field by field
     @webhook_ns.response(200, 'Webhook processed successfully', success_response_model)
     @webhook_ns.response(400, 'Bad request', error_response_model)
     @webhook_ns.response(401, 'Invalid signature', error_response_model)
+    @webhook_ns.response(413, 'Payload too large', error_response_model)
     @webhook_ns.response(500, 'Internal server error', error_response_model)
     @webhook_ns.param('X-GitHub-Event', 'GitHub event type (workflow_run or workflow_job)', 'header', required=True)
     @webhook_ns.param('X-Hub-Signature-256', 'GitHub webhook signature', 'header')
@@ -251,78 +555,70 @@ class GitHubWebhook(Resource):
         - workflow_job: Individual job execution events
         """
         try:
-            # Get request data
-            payload_body = request.get_data()
+            # Get request headers
             signature_header = request.headers.get('X-Hub-Signature-256')
             event_type = request.headers.get('X-GitHub-Event')
             
+            # Process workflow_run and workflow_job events; anything else is
+            # dropped before paying for signature verification over the body
+            if event_type not in _ROW_BUILDERS:
+                logger.debug("Ignoring event type: %s", event_type)
+                return {'message': 'Event type not supported'}, 200
+            
+            # Read the body only for events we handle
+            payload_body = request.get_data()
+            
             # Verify webhook signature
             if not verify_webhook_signature(payload_body, signature_header):
                 logger.warning("Invalid webhook signature")
                 return {'error': 'Invalid signature'}, 401
             
-            # Process workflow_run and workflow_job events
-            if event_type not in ['workflow_run', 'workflow_job']:
-                logger.info(f"Ignoring event type: {event_type}")
-                return {'message': 'Event type not supported'}, 200
-            
-            # Parse JSON payload
-            payload = request.get_json()
-            if not payload:
+            # Parse the body already read for the signature check rather than
+            # having Flask buffer and decode it a second time
+            try:
+                payload = orjson.loads(payload_body)
+            except ValueError:
+                payload = None
+            if not payload or not isinstance(payload, dict):
                 return {'error': 'Invalid JSON payload'}, 400
             
-            repository = payload.get('repository', {})
-            repo_name = repository.get('full_name')
-            
-            if event_type == 'workflow_run':
-                # Extract workflow run data
-                workflow_run = payload.get('workflow_run', {})
-                workflow_id = workflow_run.get('workflow_id')
-                workflow_name = workflow_run.get('name')
-                workflow_conclusion = workflow_run.get('conclusion')
-                run_id = workflow_run.get('id')
-                run_number = workflow_run.get('run_number')
-                run_url = workflow_run.get('html_url')
-                head_branch = workflow_run.get('head_branch')
-            else:  # workflow_job
-                # Extract workflow job data
-                workflow_job = payload.get('workflow_job', {})
-                workflow_id = workflow_job.get('id')  # Use job ID as workflow_id
-                workflow_name = workflow_job.get('workflow_name', workflow_job.get('name'))
-                workflow_conclusion = workflow_job.get('conclusion')
-                run_id = workflow_job.get('run_id')
-                run_number = None  # Not available in workflow_job
-                run_url = workflow_job.get('run_url')
-                head_branch = workflow_job.get('head_branch')
+            row = _ROW_BUILDERS[event_type](payload)
             
             # Validate required fields
-            if not all([repo_name, workflow_id, workflow_name]):
+            if not all([row.repo_name, row.workflow_id, row.workflow_name]):
                 missing_fields = []
-                if not repo_name: missing_fields.append('repository.full_name')
-                if not workflow_id: missing_fields.append(f'{event_type}.workflow_id' if event_type == 'workflow_run' else f'{event_type}.id')
-                if not workflow_name: missing_fields.append(f'{event_type}.name')
+                if not row.repo_name: missing_fields.append('repository.full_name')
+                if not row.workflow_id: missing_fields.append(f'{event_type}.workflow_id' if event_type == 'workflow_run' else f'{event_type}.id')
+                if not row.workflow_name: missing_fields.append(f'{event_type}.name')
                 
-                logger.error(f"Missing required fields: {missing_fields}")
+                logger.error("Missing required fields: %s", missing_fields)
                 return {'error': f'Missing required fields: {missing_fields}'}, 400
             
+            # Objects and arrays can't be stored in a column; reject them here since
+            # the write happens after this webhook has been acknowledged
+            invalid_fields = [field for field, value in zip(row._fields, row)
+                              if value is not None and not isinstance(value, (str, int, float))]
+            if invalid_fields:
+                logger.error("Invalid field types: %s", invalid_fields)
+                return {'error': f'Invalid field types: {invalid_fields}'}, 400
+            
             # Store in database
-            db_manager.insert_workflow_run(
-                repo_name=repo_name,
-                workflow_id=workflow_id,
-                workflow_name=workflow_name,
-                workflow_conclusion=workflow_conclusion,
-                run_id=run_id,
-                run_number=run_number,
-                run_url=run_url,
-                head_branch=head_branch
-            )
+            db_manager.insert_workflow_run(row)
             
             return {'message': 'Webhook processed successfully'}, 200
             
+        except RequestEntityTooLarge:
+            logger.warning("Webhook payload exceeds size limit")
+            return {'error': 'Payload too large'}, 413
         except Exception as e:
-            logger.error(f"Error processing webhook: {e}")
+            logger.error("Error processing webhook: %s", e)
             return {'error': 'Internal server error'}, 500
 
+@functools.lru_cache(maxsize=1)
+def _utc_timestamp(epoch_seconds):
+    """ISO-8601 UTC timestamp, formatted at most once per second"""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch_seconds))
+
 @health_ns.route('')
 class HealthCheck(Resource):
     @health_ns.doc('health_check')
@@ -338,19 +634,19 @@ class HealthCheck(Resource):
             # Test database connection
             with db_manager.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT 1')
+                cursor.execute('SELECT 1').fetchone()
             
             return {
                 'status': 'healthy',
                 'database': 'connected',
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _utc_timestamp(int(time.time()))
             }, 200
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return {
                 'status': 'unhealthy',
                 'error': str(e),
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _utc_timestamp(int(time.time()))
             }, 500
 
 workflows_list_model = api.model('WorkflowsList', {
@@ -358,50 +654,74 @@ workflows_list_model = api.model('WorkflowsList', {
     'count': fields.Integer(description='Number of workflows returned')
 })
 
+# Rows are pulled from SQLite and written to the client in chunks of this size
+STREAM_FETCH_SIZE = 500
+
+def _iter_workflow_batches(sql, params):
+    """Yield lists of workflow dicts while holding a streaming reader connection
+    
+    The first value yielded is None once the query has executed, so callers can
+    advance past it to surface SQL errors before a streamed response starts.
+    The reader is returned when the response is closed, even if the client
+    disconnects before reading every row.
+    """
+    with db_manager.get_streaming_connection() as conn, closing(conn.execute(sql, params)) as cursor:
+        columns = tuple(column[0] for column in cursor.description)
+        yield None
+        while True:
+            rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+            if not rows:
+                break
+            yield [dict(zip(columns, row)) for row in rows]
+
+def _json_body(batches):
+    """Encode workflow batches as the {"workflows": [...], "count": n} document"""
+    yield b'{"workflows":['
+    count = 0
+    for batch in batches:
+        if count:
+            yield b','
+        yield b','.join(orjson.dumps(workflow) for workflow in batch)
+        count += len(batch)
+    yield b'],"count":%d}' % count
+
+def _ndjson_body(batches):
+    """Encode workflow batches as newline-delimited JSON, one workflow per line"""
+    for batch in batches:
+        yield b''.join(orjson.dumps(workflow) + b'\n' for workflow in batch)
+
 @workflows_ns.route('')
 class WorkflowsList(Resource):
     @workflows_ns.doc('get_workflows')
+    @workflows_ns.produces(['application/json', 'application/x-ndjson'])
     @workflows_ns.response(200, 'Workflows retrieved successfully', workflows_list_model)
     @workflows_ns.response(500, 'Internal server error', error_response_model)
     @workflows_ns.param('limit', 'Maximum number of workflows to return (default: 50)', type=int)
-    @workflows_ns.param('repository', 'Filter by repository name (partial match)', type=str)
+    @workflows_ns.param('repository', 'Filter by repository name prefix, e.g. owner or owner/repo (case-insensitive)', type=str)
     def get(self):
         """
         Get workflow runs from database
         
         Retrieves workflow run data with optional filtering and pagination.
+        Rows are streamed as they are read; send `Accept: application/x-ndjson`
+        to receive one JSON object per line instead of a single document.
         """
         try:
             limit = request.args.get('limit', 50, type=int)
             repo_filter = request.args.get('repository')
             
-            with db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                if repo_filter:
-                    cursor.execute('''
-                        SELECT * FROM workflow_runs 
-                        WHERE repository_name LIKE ?
-                        ORDER BY created_at DESC 
-                        LIMIT ?
-                    ''', (f'%{repo_filter}%', limit))
-                else:
-                    cursor.execute('''
-                        SELECT * FROM workflow_runs 
-                        ORDER BY created_at DESC 
-                        LIMIT ?
-                    ''', (limit,))
-                
-                rows = cursor.fetchall()
-                workflows = [dict(row) for row in rows]
-                
-            return {
-                'workflows': workflows,
-                'count': len(workflows)
-            }, 200
+            if repo_filter:
+                batches = _iter_workflow_batches(_SQL_SELECT_BY_REPO, (f'{repo_filter}%', limit))
+            else:
+                batches = _iter_workflow_batches(_SQL_SELECT_ALL, (limit,))
+            next(batches)  # Run the query now so failures still return a 500
+            
+            if request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson':
+                return Response(_ndjson_body(batches), mimetype='application/x-ndjson')
+            return Response(_json_body(batches), mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Error fetching workflows: {e}")
+            logger.error("Error fetching workflows: %s", e)
             return {'error': 'Internal server error'}, 500
 
 info_response_model = api.model('ServiceInfo', {
@@ -435,9 +755,11 @@ class ServiceInfo(Resource):
         }, 200
 
 if __name__ == '__main__':
-    logger.info(f"Starting GitHub Workflow Webhook Server on {HOST}:{PORT}")
-    logger.info(f"Database: {DATABASE_PATH}")
-    logger.info(f"Webhook secret configured: {'Yes' if WEBHOOK_SECRET else 'No'}")
+    logger.info("Starting GitHub Workflow Webhook Server on %s:%s", HOST, PORT)
+    logger.info("Database: %s", DATABASE_PATH)
+    logger.info("Webhook secret configured: %s", 'Yes' if WEBHOOK_SECRET else 'No')
+    logger.info("Signature verification backend: %s", ssl.OPENSSL_VERSION)
     logger.info("Configuration loaded from config.json")
     
+    # Development server only; production runs under gunicorn (see entrypoint.sh)
     app.run(host=HOST, port=PORT, debug=False)
\ No newline at end of file
@@ -21,16 +21,20 @@ cleanup() {
 trap cleanup SIGTERM SIGINT
 
 # Start backend service in background
+# A single gunicorn worker keeps one connection pool and batch writer thread;
+# request concurrency comes from the worker's thread pool
 echo "Starting backend service..."
-python Backend.py &
+gunicorn --workers 1 --threads 32 --bind 0.0.0.0:8081 Backend:app &
 BACKEND_PID=$!
 
 # Wait a moment for backend to start
 sleep 2
 
 # Start frontend service in background
+# Socket.IO needs a single eventlet worker: clients and the database monitor
+# share one event loop and the in-process change tracking
 echo "Starting frontend service..."
-python frontend.py &
+gunicorn --worker-class eventlet --workers 1 --bind 0.0.0.0:8080 'frontend:create_app()' &
 FRONTEND_PID=$!
 
 # Wait a moment for frontend to start
@@ -1,11 +1,30 @@
-from flask import Flask, render_template_string
+# Patch blocking stdlib calls before anything imports them, so every Socket.IO
+# client and background task shares one green-thread event loop
+import eventlet
+eventlet.monkey_patch()
+
+from flask import Flask, Response, render_template_string, request
 from flask_socketio import SocketIO, emit
+import os
 import sqlite3
 import threading
+import queue
+import atexit
 import time
+import itertools
+import gzip
+import hashlib
 import json
+import orjson
 import logging
-from datetime import datetime
+import re
+import random
+from datetime import datetime, timedelta, timezone
+from collections import deque
+from contextlib import contextmanager
+from typing import NamedTuple
+from rcssmin import cssmin
+from rjsmin import jsmin
 
 # Configure logging
 logging.basicConfig(
@@ -19,13 +38,13 @@ def load_config(config_path='config.json'):
     try:
         with open(config_path, 'r') as f:
             config = json.load(f)
-        logger.info(f"Configuration loaded from {config_path}")
+        logger.info("Configuration loaded from %s", config_path)
         return config
     except FileNotFoundError:
-        logger.error(f"Config file {config_path} not found")
+        logger.error("Config file %s not found", config_path)
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in config file: {e}")
+        logger.error("Invalid JSON in config file: %s", e)
         raise
 
 # Load configuration
@@ -37,163 +56,379 @@ PORT = config['frontend']['port']
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = SECRET_KEY
-socketio = SocketIO(app, cors_allowed_origins="*")
+class OrjsonSocketIO:
+    """json module stand-in so Socket.IO packets are encoded with orjson"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet', json=OrjsonSocketIO)
+
+# Per-connection SQLite settings, applied in ConnectionPool.connect; WAL itself
+# is persistent and set in init_database. Warm pages are read through a 256 MB
+# mmap and a 64 MB page cache instead of read() syscalls.
+SQLITE_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA busy_timeout=5000',
+)
+
+# Prepared statements kept per connection; enough for every QUERIES variant
+# plus the writer's statements, so repeated SQL text skips parse and codegen
+SQLITE_CACHED_STATEMENTS = 256
+
+# Set SQL_TRACE=1 to log every statement the dashboard runs, e.g. to see which
+# writes dominate before changing the schema
+SQL_TRACE = os.getenv('SQL_TRACE', '').strip().lower() not in ('', '0', 'false', 'no', 'off')
+sql_logger = logging.getLogger(f'{__name__}.sql')
+
+class ConnectionPool:
+    """Persistent SQLite connections: one writer plus a set of query-only readers"""
+    
+    def __init__(self, db_path, readers=4):
+        self.db_path = db_path
+        # Autocommit writer: batches open BEGIN IMMEDIATE themselves, so the
+        # write lock is taken up front instead of upgraded mid-transaction
+        self._writer = self.connect(isolation_level=None)
+        self._writer_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self.connect(readonly=True))
+    
+    def connect(self, readonly=False, **kwargs):
+        """Open a tuned connection usable from any thread"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=SQLITE_CACHED_STATEMENTS, **kwargs)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        if SQL_TRACE:
+            conn.set_trace_callback(sql_logger.info)
+        if readonly:
+            conn.execute('PRAGMA query_only=1')
+        return conn
+    
+    @contextmanager
+    def read(self):
+        """Check out a reader connection until the block exits"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    @contextmanager
+    def write(self):
+        """Hold the single writer connection until the block exits"""
+        with self._writer_lock:
+            try:
+                yield self._writer
+            finally:
+                if self._writer.in_transaction:
+                    self._writer.rollback()
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._writer_lock:
+            self._writer.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+pool = ConnectionPool(DATABASE)
+atexit.register(pool.close)
+
+# Seconds between checks for commits made by other processes
+MONITOR_INTERVAL = 1
+
+# Seconds to wait after a change before broadcasting, so bursts coalesce
+EMIT_COALESCE_WINDOW = 0.2
+
+# Set by in-process writers after committing to wake the monitor early
+db_changed = threading.Event()
+
+# Newest updated_at sent to each Socket.IO client, keyed by request.sid
+client_watermarks = {}
+
+# Connected Socket.IO sids; clients_present is set while there is at least one
+connected_clients = set()
+clients_present = threading.Event()
+
+# Seconds between simulated workflow updates
+SIM_INTERVAL = 10
+
+# Simulated updates drawn per block; max(rowid) is refreshed once per block
+SIM_PREROLL_SIZE = 100
+
+SIM_CONCLUSIONS = ('success', 'failed', 'pending')
+
+class GroupCommitSettings(NamedTuple):
+    """How the update writer groups queued updates into one commit"""
+    min_batch: int    # commit as soon as this many are in hand and the queue is idle
+    max_batch: int    # never put more than this many in one commit
+    max_wait_us: int  # longest a batch waits for more updates, in microseconds
+    
+    @classmethod
+    def high_throughput(cls):
+        return cls(min_batch=100, max_batch=5000, max_wait_us=50_000)
+    
+    @classmethod
+    def low_latency(cls):
+        return cls(min_batch=1, max_batch=500, max_wait_us=2_000)
+
+UPDATE_COMMIT_SETTINGS = GroupCommitSettings.low_latency()
+
+# Committed update batches between passive WAL checkpoints
+WAL_CHECKPOINT_BATCHES = 50
+
+# Attempts per update batch when the database stays locked past busy_timeout
+WRITE_RETRY_ATTEMPTS = 5
+
+# (conclusion, id) updates waiting to be written by update_writer. There is one
+# producer and one consumer, and deque append/popleft are atomic, so the buffer
+# itself needs no lock; updates_ready only wakes an idle writer.
+update_buffer = deque()
+updates_ready = threading.Event()
+
+# One timestamp is bound per batch, matching how the backend's upsert stamps updated_at
+_SQL_UPDATE_CONCLUSION = '''
+    UPDATE workflow_runs 
+    SET workflow_conclusion = ?, updated_at = ?
+    WHERE id = ?
+'''
 
 def init_database():
     """Initialize the database to match backend schema"""
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    
-    # Create workflow_runs table (same as backend)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS workflow_runs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            repository_name TEXT NOT NULL,
-            workflow_id INTEGER NOT NULL,
-            workflow_name TEXT NOT NULL,
-            workflow_conclusion TEXT,
-            run_id INTEGER,
-            run_number INTEGER,
-            run_url TEXT,
-            head_branch TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Create index for better query performance
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_repository_workflow 
-        ON workflow_runs(repository_name, workflow_id)
-    ''')
-    
-    # Insert sample data if table is empty
-    cursor.execute('SELECT COUNT(*) FROM workflow_runs')
-    if cursor.fetchone()[0] == 0:
-        sample_data = [
-            ('frontend/demo-app', 12345, 'Deploy Application', 'success', 67890, 15, 
-             'https://github.com/frontend/demo-app/actions/runs/67890', 'main'),
-            ('frontend/demo-app', 12346, 'Run Tests', 'pending', 67891, 16, 
-             'https://github.com/frontend/demo-app/actions/runs/67891', 'feature/new-ui'),
-            ('frontend/demo-app', 12347, 'Build Docker Image', 'failed', 67892, 17, 
-             'https://github.com/frontend/demo-app/actions/runs/67892', 'develop'),
-            ('backend/api-service', 12348, 'Database Migration', 'success', 67893, 8, 
-             'https://github.com/backend/api-service/actions/runs/67893', 'main'),
-            ('security/scanner', 12349, 'Security Scan', 'failed', 67894, 3, 
-             'https://github.com/security/scanner/actions/runs/67894', 'security-fixes')
-        ]
-        
-        for repo_name, workflow_id, workflow_name, conclusion, run_id, run_number, run_url, head_branch in sample_data:
-            cursor.execute('''
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        
+        # WAL lets dashboard reads proceed while the backend is writing
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
+        # Create workflow_runs table (same as backend)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS workflow_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                repository_name TEXT NOT NULL,
+                workflow_id INTEGER NOT NULL,
+                workflow_name TEXT NOT NULL,
+                workflow_conclusion TEXT,
+                run_id INTEGER,
+                run_number INTEGER,
+                run_url TEXT,
+                head_branch TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create index for better query performance
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_repository_workflow 
+            ON workflow_runs(repository_name, workflow_id)
+        ''')
+        
+        # Every dashboard query orders by updated_at DESC; these let SQLite
+        # walk rows in order instead of sorting the whole filtered set
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_updated_at
+            ON workflow_runs(updated_at DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_conclusion_updated
+            ON workflow_runs(workflow_conclusion, updated_at DESC)
+        ''')
+        
+        # Insert sample data if table is empty; probing for one row avoids
+        # counting the whole table on every startup. The write lock is held
+        # from the probe on so the backend cannot insert in between.
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('SELECT 1 FROM workflow_runs LIMIT 1')
+        if cursor.fetchone() is None:
+            sample_data = [
+                ('frontend/demo-app', 12345, 'Deploy Application', 'success', 67890, 15, 
+                 'https://github.com/frontend/demo-app/actions/runs/67890', 'main'),
+                ('frontend/demo-app', 12346, 'Run Tests', 'pending', 67891, 16, 
+                 'https://github.com/frontend/demo-app/actions/runs/67891', 'feature/new-ui'),
+                ('frontend/demo-app', 12347, 'Build Docker Image', 'failed', 67892, 17, 
+                 'https://github.com/frontend/demo-app/actions/runs/67892', 'develop'),
+                ('backend/api-service', 12348, 'Database Migration', 'success', 67893, 8, 
+                 'https://github.com/backend/api-service/actions/runs/67893', 'main'),
+                ('security/scanner', 12349, 'Security Scan', 'failed', 67894, 3, 
+                 'https://github.com/security/scanner/actions/runs/67894', 'security-fixes')
+            ]
+            
+            # One prepared statement and one commit for the whole seed
+            cursor.executemany('''
                 INSERT INTO workflow_runs 
                 (repository_name, workflow_id, workflow_name, workflow_conclusion, run_id, run_number, run_url, head_branch)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (repo_name, workflow_id, workflow_name, conclusion, run_id, run_number, run_url, head_branch))
-    
-    conn.commit()
-    conn.close()
+            ''', sample_data)
+        
+        cursor.execute('COMMIT')
 
-def get_workflows(time_filter='all', conclusion_filter='all', include_ids=None, timezone_offset=0):
-    """Fetch filtered workflows from database with smart filtering"""
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    
-    # Build WHERE clause based on filters
+# Time filter conditions on updated_at; the ? are UTC bounds from _time_filter_bounds
+TIME_FILTER_CONDITIONS = {
+    'all': None,
+    'last_hour': "updated_at >= ?",
+    'current_day': "updated_at >= ? AND updated_at < ?",
+    'previous_day': "updated_at >= ? AND updated_at < ?",
+    'current_week': "updated_at >= ? AND updated_at < ?",
+    'previous_week': "updated_at >= ? AND updated_at < ?",
+}
+
+def _time_filter_bounds(time_filter, timezone_offset):
+    """Compute the UTC bounds of a time filter in the user's timezone"""
+    now = datetime.now(timezone.utc)
+    if time_filter == 'last_hour':
+        bounds = (now - timedelta(hours=1),)
+    else:
+        # JS offsets are minutes behind UTC, so negate them. Client input, so
+        # coerce it and keep it inside the open day range timezone() accepts
+        try:
+            timezone_offset = max(-1439, min(1439, int(timezone_offset)))
+        except (TypeError, ValueError, OverflowError):
+            timezone_offset = 0
+        local_now = now.astimezone(timezone(timedelta(minutes=-timezone_offset)))
+        today = local_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Weeks run Sunday to Saturday
+        week = today - timedelta(days=(today.weekday() + 1) % 7)
+        bounds = {
+            'current_day': (today, today + timedelta(days=1)),
+            'previous_day': (today - timedelta(days=1), today),
+            'current_week': (week, week + timedelta(days=7)),
+            'previous_week': (week - timedelta(days=7), week),
+        }[time_filter]
+    # updated_at holds CURRENT_TIMESTAMP text, which is UTC
+    return [bound.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S') for bound in bounds]
+
+def _window_bounds(time_filter, timezone_offset):
+    """UTC bounds for a time filter's condition, empty for 'all'"""
+    if time_filter not in TIME_FILTER_CONDITIONS or time_filter == 'all':
+        return []
+    return _time_filter_bounds(time_filter, timezone_offset)
+
+def _build_workflows_query(time_filter, has_conclusion, has_ids, has_since):
+    """Build the workflow list query for one combination of filters"""
     where_conditions = []
-    params = []
     
-    # Time-based filtering (adjust for user's timezone)
-    if time_filter != 'all':
-        # Convert timezone offset from minutes to hours for SQLite
-        offset_hours = -timezone_offset / 60  # Negative because JS offset is opposite of standard
-        offset_str = f"{'+' if offset_hours >= 0 else ''}{offset_hours:.1f} hours"
-        
-        if time_filter == 'last_hour':
-            where_conditions.append(f"updated_at >= datetime('now', 'localtime', '-1 hour', '{offset_str}')")
-        elif time_filter == 'current_day':
-            where_conditions.append(f"date(updated_at, 'localtime', '{offset_str}') = date('now', 'localtime', '{offset_str}')")
-        elif time_filter == 'previous_day':
-            where_conditions.append(f"date(updated_at, 'localtime', '{offset_str}') = date('now', 'localtime', '{offset_str}', '-1 day')")
-        elif time_filter == 'current_week':
-            # Sunday to Saturday of current week in user's timezone
-            where_conditions.append(f"date(updated_at, 'localtime', '{offset_str}') >= date('now', 'localtime', '{offset_str}', 'weekday 6', '-6 days') AND date(updated_at, 'localtime', '{offset_str}') <= date('now', 'localtime', '{offset_str}', 'weekday 6')")
-        elif time_filter == 'previous_week':
-            # Sunday to Saturday of previous week in user's timezone
-            where_conditions.append(f"date(updated_at, 'localtime', '{offset_str}') >= date('now', 'localtime', '{offset_str}', 'weekday 6', '-13 days') AND date(updated_at, 'localtime', '{offset_str}') <= date('now', 'localtime', '{offset_str}', 'weekday 6', '-7 days')")
-    
-    # Smart conclusion-based filtering
-    if conclusion_filter != 'all':
-        if include_ids and len(include_ids) > 0:
-            # Include items matching filter OR previously displayed items
-            placeholders = ','.join(['?' for _ in include_ids])
-            where_conditions.append(f"(workflow_conclusion = ? OR id IN ({placeholders}))")
-            params.append(conclusion_filter)
-            params.extend(include_ids)
+    if TIME_FILTER_CONDITIONS[time_filter]:
+        where_conditions.append(TIME_FILTER_CONDITIONS[time_filter])
+    
+    # Smart conclusion-based filtering; previously displayed items stay
+    # visible. Their ids arrive as one JSON array so the SQL text is fixed.
+    if has_conclusion:
+        if has_ids:
+            where_conditions.append("(workflow_conclusion = ? OR id IN (SELECT value FROM json_each(?)))")
         else:
-            # Standard filtering
             where_conditions.append("workflow_conclusion = ?")
-            params.append(conclusion_filter)
     
-    # Build final query
-    base_query = '''
-        SELECT id, repository_name, workflow_id, workflow_name, workflow_conclusion, 
-               run_id, run_number, run_url, head_branch, created_at, updated_at
+    # Delta sync: only rows touched since the client's watermark. updated_at
+    # has one-second resolution, so rows from the watermark second are sent
+    # again and the client merges them by id.
+    if has_since:
+        where_conditions.append("updated_at >= ?")
+    
+    query = '''
+        SELECT id, repository_name, workflow_id,
+               workflow_name AS name,  -- mapped to name for UI compatibility
+               workflow_conclusion AS conclusion,
+               run_id, run_number, run_url, head_branch, created_at, updated_at,
+               CASE WHEN workflow_conclusion IN ('success', 'failed')
+                    THEN 'completed' ELSE 'in_progress' END AS status
         FROM workflow_runs
     '''
-    
     if where_conditions:
-        query = base_query + ' WHERE ' + ' AND '.join(where_conditions) + ' ORDER BY updated_at DESC'
-    else:
-        query = base_query + ' ORDER BY updated_at DESC'
+        query += ' WHERE ' + ' AND '.join(where_conditions)
+    return query + ' ORDER BY updated_at DESC'
+
+# Every query get_workflows can issue, keyed by
+# (time_filter, has_conclusion, has_ids, has_since). Fixed SQL text lets the
+# connection's statement cache reuse the prepared statements. Tracked ids only
+# apply alongside a conclusion filter, so has_ids implies has_conclusion.
+QUERIES = {
+    key: _build_workflows_query(*key)
+    for key in itertools.product(TIME_FILTER_CONDITIONS, (False, True), (False, True), (False, True))
+    if key[1] or not key[2]
+}
+
+# Rows fetched per round trip to the cursor while building a workflow list
+FETCH_SIZE = 500
+
+def get_workflows(time_filter='all', conclusion_filter='all', include_ids=None, timezone_offset=0, updated_since=None):
+    """Fetch filtered workflows from database with smart filtering"""
+    if time_filter not in TIME_FILTER_CONDITIONS:
+        time_filter = 'all'
+    has_conclusion = conclusion_filter != 'all'
+    has_ids = has_conclusion and bool(include_ids)
     
-    cursor.execute(query, params)
-    workflows = cursor.fetchall()
-    conn.close()
+    query = QUERIES[(time_filter, has_conclusion, has_ids, updated_since is not None)]
+    params = []
+    
+    # Time-based filtering (adjust for user's timezone)
+    params.extend(_window_bounds(time_filter, timezone_offset))
+    
+    if has_conclusion:
+        params.append(conclusion_filter)
+    if has_ids:
+        params.append(json.dumps(include_ids))
+    
+    if updated_since is not None:
+        params.append(updated_since)
     
-    # Convert to list of dictionaries
+    # Build dicts a chunk at a time so the raw rows are never all held at once.
+    # Columns are already aliased to the dashboard's keys, so plain tuples
+    # zipped with the column names give the dicts directly.
     workflow_list = []
-    for workflow in workflows:
-        workflow_list.append({
-            'id': workflow[0],
-            'repository_name': workflow[1],
-            'workflow_id': workflow[2],
-            'name': workflow[3],  # workflow_name mapped to name for UI compatibility
-            'conclusion': workflow[4],  # workflow_conclusion mapped to conclusion
-            'run_id': workflow[5],
-            'run_number': workflow[6],
-            'run_url': workflow[7],
-            'head_branch': workflow[8],
-            'created_at': workflow[9],
-            'updated_at': workflow[10],
-            'status': 'completed' if workflow[4] in ['success', 'failed'] else 'in_progress',  # derive status from conclusion            
-        })
+    with pool.read() as conn:
+        cursor = conn.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            workflow_list.extend(dict(zip(columns, row)) for row in rows)
     
     return workflow_list
 
 def monitor_database():
     """Monitor database changes and emit updates"""
-    last_update = None
+    # data_version changes whenever another connection (including the backend
+    # process) commits, so checking it costs no table reads. A dedicated
+    # connection is required because the counter is tracked per connection.
+    conn = pool.connect(readonly=True)
+    last_version = conn.execute('PRAGMA data_version').fetchone()[0]
     
     while True:
+        # With no dashboard open there is nobody to notify, so block instead
+        # of polling; a client that connects later gets a full list anyway
+        clients_present.wait()
+        
+        # Local writers set db_changed so their commits are picked up immediately
+        db_changed.wait(timeout=MONITOR_INTERVAL)
+        db_changed.clear()
+        
         try:
-            conn = sqlite3.connect(DATABASE)
-            cursor = conn.cursor()
-            cursor.execute('SELECT MAX(updated_at) FROM workflow_runs')
-            current_update = cursor.fetchone()[0]
-            conn.close()
-            
-            if last_update is None:
-                last_update = current_update
-            elif current_update != last_update:
-                # Database has been updated
-                workflows = get_workflows()
-                socketio.emit('workflow_update', {'workflows': workflows})
-                last_update = current_update
+            current_version = conn.execute('PRAGMA data_version').fetchone()[0]
+            if current_version != last_version:
+                # Database has been updated; let the rest of a burst land so
+                # clients get one broadcast for all of it
+                time.sleep(EMIT_COALESCE_WINDOW)
+                db_changed.clear()
+                last_version = conn.execute('PRAGMA data_version').fetchone()[0]
+                
+                # Clients pull only the rows they are missing, so the
+                # broadcast is just a signal. Fanning it out to every client
+                # runs as its own task so polling never waits on the network.
+                socketio.start_background_task(socketio.emit, 'workflow_update', {})
                 
         except Exception as e:
-            logger.error(f"Database monitoring error: {e}")
-            
-        time.sleep(2)  # Check every 2 seconds
+            logger.error("Database monitoring error: %s", e)
 
 # HTML Template
 HTML_TEMPLATE = '''
@@ -582,6 +817,7 @@ HTML_TEMPLATE = '''
         
         // Track displayed workflows for smart filtering
         let displayedWorkflowIds = new Set();
+        let currentWorkflows = [];
         
         // Timezone utility functions
         function getLocalTimezoneOffset() {
@@ -633,11 +869,95 @@ HTML_TEMPLATE = '''
         socket.on('workflow_update', function(data) {
             // Database change detected - if auto-refresh is off, update immediately
             if (currentRefreshRate === 'off') {
-                requestWorkflows();
+                requestWorkflows(false, true);
             }
             // If auto-refresh is on, let the timer handle updates
         });
         
+        function mergeWorkflows(changed, bounds) {
+            // Drop rows that have aged out of the time window, e.g. yesterday's
+            // rows under "Current Day"; [start] or [start, end], empty for all time
+            const [start, end] = bounds || [];
+            const inWindow = workflow =>
+                (!start || workflow.updated_at >= start) && (!end || workflow.updated_at < end);
+            
+            // Replace changed rows by id and keep newest-first ordering
+            const byId = new Map(currentWorkflows.map(workflow => [workflow.id, workflow]));
+            changed.forEach(workflow => byId.set(workflow.id, workflow));
+            const merged = Array.from(byId.values()).filter(inWindow).sort((a, b) =>
+                a.updated_at < b.updated_at ? 1 : a.updated_at > b.updated_at ? -1 : 0);
+            
+            if (changed.length === 0 && merged.length === currentWorkflows.length) {
+                return;
+            }
+            scheduleRender(merged);
+        }
+        
+        // Render at most once per animation frame: lists that arrive within the
+        // same frame replace each other and only the newest reaches the DOM
+        let pendingRender = null;
+        
+        function scheduleRender(workflows) {
+            // Later deltas merge against the newest list, rendered or not
+            currentWorkflows = workflows;
+            
+            if (pendingRender === null) {
+                requestAnimationFrame(() => {
+                    const latest = pendingRender;
+                    pendingRender = null;
+                    updateWorkflows(latest);
+                });
+            }
+            pendingRender = workflows;
+        }
+        
+        // Card elements keyed by workflow id, so updates only touch what changed
+        const cardById = new Map();
+        const cardTemplate = document.createElement('template');
+        cardTemplate.innerHTML = `
+            <div class="workflow-card">
+                <div class="workflow-header">
+                    <div class="workflow-name"></div>
+                    <div class="conclusion-badge"></div>
+                </div>
+                
+                <div class="workflow-details">
+                    <p><strong>Repo:</strong> <span class="status-text"></span></p>
+                    <p><strong>Branch:</strong> <span class="workflow-branch"></span></p>
+                    <p><strong>Run:</strong> <span class="workflow-run"></span></p>
+                </div>
+                
+                <div class="workflow-meta">
+                    <span><strong>Updated:</strong> <span class="workflow-updated"></span></span>
+                </div>
+            </div>
+        `.trim();
+        
+        function renderWorkflowCard(card, workflow) {
+            card.querySelector('.workflow-name').textContent = workflow.name;
+            
+            const badge = card.querySelector('.conclusion-badge');
+            badge.className = `conclusion-badge conclusion-${workflow.conclusion}`;
+            badge.textContent = workflow.conclusion;
+            
+            card.querySelector('.status-text').textContent = workflow.repository_name;
+            card.querySelector('.workflow-branch').textContent = workflow.head_branch;
+            
+            const run = card.querySelector('.workflow-run');
+            if (workflow.run_url) {
+                const link = document.createElement('a');
+                link.href = workflow.run_url;
+                link.target = '_blank';
+                link.style.cssText = 'color: #2196F3; text-decoration: none;';
+                link.textContent = `#${workflow.run_number}`;
+                run.replaceChildren(link);
+            } else {
+                run.textContent = `#${workflow.run_number || 'N/A'}`;
+            }
+            
+            card.querySelector('.workflow-updated').textContent = convertUTCToLocal(workflow.updated_at);
+        }
+        
         function updateWorkflows(workflows) {
             const container = document.getElementById('workflowsContainer');
             
@@ -648,37 +968,47 @@ HTML_TEMPLATE = '''
             displayedWorkflowIds.clear();
             workflows.forEach(workflow => displayedWorkflowIds.add(workflow.id));
             
-            container.innerHTML = workflows.map(workflow => {
+            // Drop cards that are no longer in the list
+            cardById.forEach((card, id) => {
+                if (!displayedWorkflowIds.has(id)) {
+                    card.remove();
+                    cardById.delete(id);
+                }
+            });
+            
+            // Walk the list in order, re-rendering only new or changed cards
+            // and moving a card only when it is out of place
+            let position = container.firstElementChild;
+            workflows.forEach(workflow => {
                 // Check if this workflow doesn't match current filter (status changed)
                 const statusChanged = currentFilters.conclusion_filter !== 'all' && 
                                     workflow.conclusion !== currentFilters.conclusion_filter &&
                                     previousIds.has(workflow.id);
                 
-                return `
-                <div class="workflow-card ${workflow.conclusion} pulse ${statusChanged ? 'status-changed' : ''}">
-                    <div class="workflow-header">
-                        <div class="workflow-name">${workflow.name}</div>
-                        <div class="conclusion-badge conclusion-${workflow.conclusion}">
-                            ${workflow.conclusion}
-                        </div>
-                    </div>
-                    
-                    <div class="workflow-details">
-                        <p><strong>Repo:</strong> <span class="status-text">${workflow.repository_name}</span></p>
-                        <p><strong>Branch:</strong> ${workflow.head_branch }</p>
-                        <p><strong>Run:</strong> ${workflow.run_url ? `<a href="${workflow.run_url}" target="_blank" style="color: #2196F3; text-decoration: none;">#${workflow.run_number}</a>` : `#${workflow.run_number || 'N/A'}`}</p>
-                    </div>
-                    
-                    <div class="workflow-meta">
-                        <span><strong>Updated:</strong> ${convertUTCToLocal(workflow.updated_at)}</span>
-                    </div>
-                </div>
-                `;
-            }).join('');
+                let card = cardById.get(workflow.id);
+                if (!card) {
+                    card = cardTemplate.content.firstElementChild.cloneNode(true);
+                    cardById.set(workflow.id, card);
+                }
+                
+                const version = [workflow.updated_at, workflow.conclusion, workflow.name, workflow.run_number].join('|');
+                if (card.dataset.version !== version) {
+                    renderWorkflowCard(card, workflow);
+                    card.dataset.version = version;
+                    card.className = `workflow-card ${workflow.conclusion} pulse`;
+                }
+                card.classList.toggle('status-changed', statusChanged);
+                
+                if (card === position) {
+                    position = position.nextElementSibling;
+                } else {
+                    container.insertBefore(card, position);
+                }
+            });
             
             // Remove pulse animation after a short delay
             setTimeout(() => {
-                document.querySelectorAll('.pulse').forEach(el => {
+                container.querySelectorAll('.pulse').forEach(el => {
                     el.classList.remove('pulse');
                 });
             }, 2000);
@@ -713,7 +1043,26 @@ HTML_TEMPLATE = '''
             startAutoRefresh();
         }
         
-        function requestWorkflows(clearTracking = false) {
+        // Coalesce bursts of requests (dropdown toggling, change signals) into
+        // one round-trip; a full or tracking-reset request wins over a delta
+        const REQUEST_DEBOUNCE_MS = 150;
+        let pendingRequest = null;
+        let requestTimer = null;
+        
+        function requestWorkflows(clearTracking = false, delta = false) {
+            pendingRequest = pendingRequest
+                ? {clearTracking: pendingRequest.clearTracking || clearTracking, delta: pendingRequest.delta && delta}
+                : {clearTracking, delta};
+            
+            clearTimeout(requestTimer);
+            requestTimer = setTimeout(() => {
+                const request = pendingRequest;
+                pendingRequest = null;
+                sendWorkflowsRequest(request.clearTracking, request.delta);
+            }, REQUEST_DEBOUNCE_MS);
+        }
+        
+        function sendWorkflowsRequest(clearTracking = false, delta = false) {
             if (clearTracking) {
                 displayedWorkflowIds.clear();
             }
@@ -721,7 +1070,8 @@ HTML_TEMPLATE = '''
             const requestData = {
                 ...currentFilters,
                 include_ids: Array.from(displayedWorkflowIds),
-                timezone_offset: getLocalTimezoneOffset()
+                timezone_offset: getLocalTimezoneOffset(),
+                delta: delta
             };
             
             socket.emit('get_workflows', requestData);
@@ -761,10 +1111,15 @@ HTML_TEMPLATE = '''
         });
         
         // Request initial data
-        requestWorkflows(true);
+        sendWorkflowsRequest(true);
         
         socket.on('initial_workflows', function(data) {
-            updateWorkflows(data.workflows);
+            scheduleRender(data.workflows);
+            updateLastUpdatedTime();
+        });
+        
+        socket.on('workflow_delta', function(data) {
+            mergeWorkflows(data.workflows, data.window);
             updateLastUpdatedTime();
         });
     </script>
@@ -772,18 +1127,56 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# Inline <style>/<script> blocks and markup indentation, for _minify_page_part
+_PAGE_PARTS = re.compile(r'(<style>)(.*?)</style>|(<script>)(.*?)</script>|\n\s+', re.S)
+
+def _minify_page_part(match):
+    """Minify one inline CSS/JS block, or collapse a line's indentation"""
+    if match.group(1):
+        return '<style>' + cssmin(match.group(2)) + '</style>'
+    if match.group(3):
+        return '<script>' + jsmin(match.group(4)) + '</script>'
+    return '\n'
+
+# The page has no server-side variables, so render it once instead of per request
+with app.app_context():
+    RENDERED_HTML = render_template_string(HTML_TEMPLATE)
+
+# Minify once at import, before the page is compressed
+RENDERED_HTML = _PAGE_PARTS.sub(_minify_page_part, RENDERED_HTML)
+
+# Pre-compressed copy for clients that accept gzip; each encoding gets its own ETag
+HTML_BYTES = RENDERED_HTML.encode('utf-8')
+HTML_GZ = gzip.compress(HTML_BYTES, 9)
+HTML_ETAG = hashlib.sha1(HTML_BYTES).hexdigest()[:16]
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # Index by name for the quality value, so "gzip;q=0" counts as a refusal
+    if request.accept_encodings['gzip'] > 0:
+        response = Response(HTML_GZ, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(HTML_ETAG + '-gz')
+    else:
+        response = Response(HTML_BYTES, mimetype='text/html')
+        response.set_etag(HTML_ETAG)
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
 
 @socketio.on('connect')
 def handle_connect():
+    connected_clients.add(request.sid)
+    clients_present.set()
     logger.info('Client connected')
     workflows = get_workflows()
     emit('initial_workflows', {'workflows': workflows})
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    client_watermarks.pop(request.sid, None)
+    connected_clients.discard(request.sid)
+    if not connected_clients:
+        clients_present.clear()
     logger.info('Client disconnected')
 
 @socketio.on('get_workflows')
@@ -792,58 +1185,189 @@ def handle_get_workflows(data=None):
     conclusion_filter = data.get('conclusion_filter', 'all') if data else 'all'
     include_ids = data.get('include_ids', []) if data else []
     timezone_offset = data.get('timezone_offset', 0) if data else 0
-    workflows = get_workflows(time_filter, conclusion_filter, include_ids, timezone_offset)
-    emit('initial_workflows', {'workflows': workflows})
+    delta = data.get('delta', False) if data else False
+    
+    # A delta is only possible once this client has received a full list
+    watermark = client_watermarks.get(request.sid) if delta else None
+    workflows = get_workflows(time_filter, conclusion_filter, include_ids, timezone_offset, watermark)
+    
+    # Rows are ordered by updated_at DESC, so the first one is the newest
+    if workflows:
+        client_watermarks[request.sid] = workflows[0]['updated_at']
+    elif watermark is None:
+        client_watermarks[request.sid] = ''
+    
+    if watermark is None:
+        emit('initial_workflows', {'workflows': workflows})
+    else:
+        # Rows age out of the time window without being touched, so the client
+        # also gets the window's bounds to drop rows it still holds outside them
+        emit('workflow_delta', {'workflows': workflows,
+                                'window': _window_bounds(time_filter, timezone_offset)})
+
+def queue_update(conclusion, workflow_id):
+    """Hand one conclusion update to update_writer"""
+    update_buffer.append((conclusion, workflow_id))
+    updates_ready.set()
+
+def _wait_for_updates(timeout=None):
+    """Sleep until queue_update adds to the buffer or the timeout passes"""
+    # Clearing before the check means an append racing with it still wakes us
+    updates_ready.clear()
+    if not update_buffer:
+        updates_ready.wait(timeout)
+
+def _collect_updates(settings):
+    """Wait for queued updates, then gather more per the group commit settings"""
+    while not update_buffer:
+        _wait_for_updates()
+    
+    batch = []
+    deadline = time.monotonic() + settings.max_wait_us / 1_000_000
+    while True:
+        while update_buffer and len(batch) < settings.max_batch:
+            batch.append(update_buffer.popleft())
+        
+        # Buffer is drained: commit now if the batch is big enough, otherwise
+        # wait for more until the deadline
+        remaining = deadline - time.monotonic()
+        if len(batch) >= settings.min_batch or len(batch) >= settings.max_batch or remaining <= 0:
+            return batch
+        _wait_for_updates(remaining)
+
+def _commit_updates(conn, latest):
+    """Write one batch of {id: conclusion} updates, retrying while the database is locked"""
+    for attempt in range(WRITE_RETRY_ATTEMPTS):
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Stamp the batch only once the write lock is held: a time taken
+            # before waiting on it could fall behind a watermark a client
+            # already stored, and the delta query would never return these rows.
+            # Same format as CURRENT_TIMESTAMP, computed once instead of per row.
+            now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            conn.executemany(_SQL_UPDATE_CONCLUSION,
+                             [(conclusion, now, workflow_id) for workflow_id, conclusion in latest.items()])
+            conn.execute('COMMIT')
+            return
+        except sqlite3.OperationalError as e:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            # busy_timeout already waited in SQLite; a lock that still beats it
+            # is retried with backoff, anything else is a real failure
+            if 'locked' not in str(e) or attempt == WRITE_RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(0.001 * (1 << attempt))
+
+def update_writer(settings=UPDATE_COMMIT_SETTINGS):
+    """Commit queued conclusion updates in groups, one transaction per batch"""
+    batches = 0
+    
+    while True:
+        batch = _collect_updates(settings)
+        
+        # Only the last conclusion queued for a workflow matters, so repeated
+        # updates to a hot row collapse into one UPDATE
+        latest = {workflow_id: conclusion for conclusion, workflow_id in batch}
+        try:
+            with pool.write() as conn:
+                _commit_updates(conn, latest)
+                
+                # Checkpoint on a fixed cadence so the WAL cannot keep growing
+                # while readers hold it open; PASSIVE never waits on them
+                batches += 1
+                if batches % WAL_CHECKPOINT_BATCHES == 0:
+                    busy, log_pages, checkpointed = conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+                    logger.info("WAL checkpoint: busy=%s log_pages=%s checkpointed=%s", busy, log_pages, checkpointed)
+            db_changed.set()
+            logger.info("Updated %d workflows", len(latest))
+        except Exception as e:
+            logger.error("Error writing workflow updates: %s", e)
+
+def _preroll_simulated_updates(count):
+    """Draw (rowid, conclusion) targets for the next count simulated updates"""
+    # max(rowid) is re-read per block so rows added since become eligible
+    with pool.read() as conn:
+        max_rowid = conn.execute('SELECT max(rowid) FROM workflow_runs').fetchone()[0] or 0
+    if not max_rowid:
+        return []
+    return list(zip(random.choices(range(1, max_rowid + 1), k=count),
+                    random.choices(SIM_CONCLUSIONS, k=count)))
 
 def simulate_database_changes():
     """Simulate database changes for demonstration"""
-    import random
+    targets = []
     
     while True:
-        time.sleep(10)  # Wait 10 seconds between updates
+        time.sleep(SIM_INTERVAL)  # Wait between updates
         
         try:
-            conn = sqlite3.connect(DATABASE)
-            cursor = conn.cursor()
-            
-            # Randomly update a workflow
-            cursor.execute('SELECT id FROM workflow_runs ORDER BY RANDOM() LIMIT 1')
-            workflow_id = cursor.fetchone()[0]
-            
-            # Random conclusions
-            conclusions = ['success', 'failed', 'pending']
-            new_conclusion = random.choice(conclusions)
-            
-            cursor.execute('''
-                UPDATE workflow_runs 
-                SET workflow_conclusion = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (new_conclusion, workflow_id))
+            # Random choices are drawn a block at a time, not per update
+            if not targets:
+                targets = _preroll_simulated_updates(SIM_PREROLL_SIZE)
+                if not targets:
+                    continue
+            rowid, conclusion = targets.pop()
             
-            conn.commit()
-            conn.close()
+            # Seek to the first row at or after the drawn rowid instead of
+            # sorting the whole table with ORDER BY RANDOM()
+            with pool.read() as conn:
+                row = conn.execute('SELECT id FROM workflow_runs WHERE rowid >= ? ORDER BY rowid LIMIT 1',
+                                   (rowid,)).fetchone()
+            if row is None:
+                # Drew past the last row (tail rows were deleted); draw a fresh block
+                targets.clear()
+                continue
             
-            logger.info(f"Updated workflow {workflow_id} to {new_conclusion}")
+            # Hand off to update_writer, which groups queued updates into one commit
+            queue_update(conclusion, row[0])
             
         except Exception as e:
-            logger.error(f"Simulation error: {e}")
+            logger.error("Simulation error: %s", e)
 
-if __name__ == '__main__':
-    # Initialize database
+def _pin_to_cpu():
+    """Pin the dashboard process to the CPU in DASHBOARD_CPU, if set (Linux only)"""
+    cpu = os.getenv('DASHBOARD_CPU')
+    if cpu is None:
+        return
+    # The monitor, writer and clients are green threads on one OS thread, so
+    # pinning the process keeps all of them and SQLite's page cache on one core
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+        logger.info("Pinned dashboard to CPU %s", cpu)
+    except (AttributeError, ValueError, OSError) as e:
+        logger.warning("Could not pin dashboard to CPU %s: %s", cpu, e)
+
+def create_app():
+    """Initialize the database, start background tasks and return the app"""
+    _pin_to_cpu()
     init_database()
     
-    # Start database monitoring thread
-    monitor_thread = threading.Thread(target=monitor_database, daemon=True)
-    monitor_thread.start()
+    # Start database monitoring as a green thread on the Socket.IO event loop
+    socketio.start_background_task(monitor_database)
+    
+    # Start the group-commit writer for queued workflow updates
+    socketio.start_background_task(update_writer)
+    
+    # Start simulation task (optional - for demonstration)
+    #socketio.start_background_task(simulate_database_changes)
+    
+    logger.info("Database: %s", DATABASE)
+    return app
+
+if __name__ == '__main__':
+    if not os.getenv('DEV'):
+        # One eventlet worker serves thousands of idle WebSocket clients; the
+        # built-in server is only meant for local development
+        logger.info("Run the dashboard under gunicorn for production: "
+                    "gunicorn --worker-class eventlet --workers 1 --bind %s:%s 'frontend:create_app()'",
+                    HOST, PORT)
+        logger.info("Set DEV=1 to start the development server instead")
+        raise SystemExit(1)
     
-    # Start simulation thread (optional - for demonstration)
-    #simulation_thread = threading.Thread(target=simulate_database_changes, daemon=True)
-    #simulation_thread.start()
+    create_app()
     
-    logger.info(f"Starting Workflow Dashboard on {HOST}:{PORT}")
-    logger.info(f"Database: {DATABASE}")
-    logger.info("Configuration loaded from config.json")
-    logger.info(f"Access the dashboard at: http://{HOST}:{PORT}")
+    logger.info("Starting Workflow Dashboard on %s:%s, access it at http://%s:%s",
+                HOST, PORT, HOST, PORT)
     
     # Run the Flask-SocketIO app
-    socketio.run(app, debug=True, host=HOST, port=PORT)
\ No newline at end of file
+    socketio.run(app, host=HOST, port=PORT)
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Tests for the webhook backend's database handling"""
+import importlib
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# workflow_runs as created before runs had a unique index
+BASELINE_SCHEMA = '''
+    CREATE TABLE workflow_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        repository_name TEXT NOT NULL,
+        workflow_id INTEGER NOT NULL,
+        workflow_name TEXT NOT NULL,
+        workflow_conclusion TEXT,
+        run_id INTEGER,
+        run_number INTEGER,
+        run_url TEXT,
+        head_branch TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+@pytest.fixture(scope='module')
+def backend(tmp_path_factory):
+    """Import Backend against a throwaway config and database"""
+    workdir = tmp_path_factory.mktemp('backend')
+    (workdir / 'config.json').write_text(json.dumps({
+        'database': {'path': str(workdir / 'workflows.db')},
+        'backend': {'host': '127.0.0.1', 'port': 8081},
+        'webhook': {'secret': None},
+    }))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    try:
+        yield importlib.import_module('Backend')
+    finally:
+        os.chdir(cwd)
+
+def _baseline_database(path, rows):
+    """Create a pre-upsert database holding the given rows"""
+    conn = sqlite3.connect(path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.executemany('''
+        INSERT INTO workflow_runs
+        (id, repository_name, workflow_id, workflow_name, workflow_conclusion, run_id, updated_at)
+        VALUES (?, 'o/r', ?, 'ci', ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+def _remaining_rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute('SELECT id, workflow_conclusion FROM workflow_runs ORDER BY id').fetchall()
+    finally:
+        conn.close()
+
+def test_duplicate_cleanup_keeps_most_recently_updated_row(backend, tmp_path):
+    path = str(tmp_path / 'baseline.db')
+    _baseline_database(path, [
+        # Two racing inserts; the later update went to the lowest id
+        (1, 10, 'success', 100, '2024-01-01 10:00:05'),
+        (2, 10, None, 100, '2024-01-01 10:00:00'),
+        # Updated in the same second as the duplicate insert: lowest id wins
+        (3, 20, 'failure', 200, '2024-01-01 11:00:00'),
+        (4, 20, None, 200, '2024-01-01 11:00:00'),
+        # A newer duplicate that was itself updated last
+        (5, 30, None, 300, '2024-01-01 12:00:00'),
+        (6, 30, 'cancelled', 300, '2024-01-01 12:00:09'),
+        # Rows without a run_id are never merged
+        (7, 40, None, None, '2024-01-01 13:00:00'),
+        (8, 40, None, None, '2024-01-01 13:00:00'),
+    ])
+
+    manager = backend.DatabaseManager(path)
+    manager.close()
+
+    assert _remaining_rows(path) == [
+        (1, 'success'),
+        (3, 'failure'),
+        (6, 'cancelled'),
+        (7, None),
+        (8, None),
+    ]
+
+def test_duplicate_cleanup_leaves_unique_runs_alone(backend, tmp_path):
+    path = str(tmp_path / 'baseline.db')
+    _baseline_database(path, [
+        (1, 10, 'success', 100, '2024-01-01 10:00:00'),
+        (2, 10, 'failure', 101, '2024-01-01 10:00:00'),
+    ])
+
+    manager = backend.DatabaseManager(path)
+    manager.close()
+
+    assert _remaining_rows(path) == [(1, 'success'), (2, 'failure')]